@@ -1,11 +1,11 @@
+from os import environ
+from typing import TYPE_CHECKING, Any
 from warnings import warn
 
 from .bound_method_wrapper import BoundMethodWrapper as BoundMethodWrapper
 from .delete_rule import DeleteConfig as DeleteConfig
 from .delete_rule import DeleteError as DeleteError
 from .delete_rule import delete_rule as delete_rule
-from .model import AgnosticClient as AgnosticClient
-from .model import AgnosticDatabase as AgnosticDatabase
 from .model import ClientProvider as ClientProvider
 from .model import DatabaseProvider as DatabaseProvider
 from .model import DeleteResultModel as DeleteResultModel
@@ -13,15 +13,17 @@ from .model import DocumentModel as DocumentModel
 from .model import StrObjectId as StrObjectId
 from .model import UTCDatetime as UTCDatetime
 from .service import DeleteResult as DeleteResult
+from .service import InsertManyResult as InsertManyResult
 from .service import InsertOneResult as InsertOneResult
 from .service import MongoService as MongoService
 from .service import UpdateResult as UpdateResult
-from .typing import AgnosticCollection as AgnosticCollection
+from .service import compile_projection as compile_projection
 from .typing import Collation as Collation
 from .typing import CollectionOptions as CollectionOptions
 from .typing import DeleteOptions as DeleteOptions
 from .typing import FindOptions as FindOptions
 from .typing import IndexData as IndexData
+from .typing import InsertManyOptions as InsertManyOptions
 from .typing import InsertOneOptions as InsertOneOptions
 from .typing import MongoProjection as MongoProjection
 from .typing import MongoQuery as MongoQuery
@@ -32,8 +34,30 @@ from .validator import ValidationError as ValidationError
 from .validator import Validator as Validator
 from .validator import validator as validator
 
-warn(
-    "FastAPI-motor-oil is deprecated and replaced by motorhead with support for Pydantic v2. See https://volfpeter.github.io/motorhead/",
-    DeprecationWarning,
-    stacklevel=2,
-)
+if TYPE_CHECKING:
+    from .model import AgnosticClient as AgnosticClient
+    from .model import AgnosticDatabase as AgnosticDatabase
+    from .typing import AgnosticCollection as AgnosticCollection
+
+if not environ.get("FMO_SILENCE_DEPRECATION"):
+    warn(
+        "FastAPI-motor-oil is deprecated and replaced by motorhead with support for Pydantic v2. See https://volfpeter.github.io/motorhead/",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolves the re-exported `motor` types on first access, so importing the package doesn't load `motor`.
+    """
+    if name in ("AgnosticClient", "AgnosticCollection", "AgnosticDatabase"):
+        from motor.core import AgnosticClient, AgnosticCollection, AgnosticDatabase
+
+        return {
+            "AgnosticClient": AgnosticClient,
+            "AgnosticCollection": AgnosticCollection,
+            "AgnosticDatabase": AgnosticDatabase,
+        }[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
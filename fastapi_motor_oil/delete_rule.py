@@ -1,11 +1,15 @@
+from __future__ import annotations
+
 from collections.abc import Callable, Coroutine, Sequence
-from typing import Literal, TypeVar
+from typing import TYPE_CHECKING, Literal, TypeVar
 
 from bson.objectid import ObjectId
-from motor.core import AgnosticClientSession
 
 from .bound_method_wrapper import BoundMethodWrapper
 
+if TYPE_CHECKING:
+    from motor.core import AgnosticClientSession
+
 __all__ = (
     "DeleteError",
     "DeleteConfig",
@@ -25,7 +29,7 @@ Delete rule configuration that specifies when a given delete rule must be execut
 """
 
 
-class DeleteRule(BoundMethodWrapper[TOwner, [AgnosticClientSession, Sequence[ObjectId]], DeleteConfig]):
+class DeleteRule(BoundMethodWrapper[TOwner, ["AgnosticClientSession", Sequence[ObjectId]], DeleteConfig]):
     """
     Delete rule wrapper.
 
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Generator
-from datetime import datetime, timezone
-from typing import Any, Protocol
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 
 from bson import ObjectId
-from motor.core import AgnosticClient, AgnosticDatabase
+from bson.errors import InvalidId
 from pydantic import BaseModel, Field
 from pydantic.datetime_parse import parse_datetime
 
+if TYPE_CHECKING:
+    from motor.core import AgnosticClient, AgnosticDatabase
+
 __all__ = (
     "AgnosticClient",
     "AgnosticDatabase",
@@ -20,22 +23,36 @@ __all__ = (
     "DeleteResultModel",
 )
 
+TDocumentModel = TypeVar("TDocumentModel", bound="DocumentModel")
+
+_ZERO_OFFSET = timedelta(0)
+
 
 class ClientProvider(Protocol):
     """
     Client provider protocol for FastAPI database dependencies.
+
+    Providers must be `async` callables, so FastAPI can await them on the event loop
+    instead of executing them in its threadpool.
+
+    Providers may return `motor`'s `AsyncIOMotorClient`, it is a subclass of `AgnosticClient`.
     """
 
-    def __call__(self) -> AgnosticClient:
+    async def __call__(self) -> AgnosticClient:
         ...
 
 
 class DatabaseProvider(Protocol):
     """
     Database provider protocol for FastAPI database dependencies.
+
+    Providers must be `async` callables, so FastAPI can await them on the event loop
+    instead of executing them in its threadpool.
+
+    Providers may return `motor`'s `AsyncIOMotorDatabase`, it is a subclass of `AgnosticDatabase`.
     """
 
-    def __call__(self) -> AgnosticDatabase:
+    async def __call__(self) -> AgnosticDatabase:
         ...
 
 
@@ -45,27 +62,41 @@ class UTCDatetime(datetime):
     """
 
     @classmethod
-    def __get_validators__(cls) -> Generator[Any, None, None]:
-        yield parse_datetime  # default pydantic behavior
-        yield cls.ensure_utc
+    def __get_validators__(cls) -> tuple[Callable[[Any], datetime]]:
+        # Pydantic accepts any iterable, a tuple is cheaper than a generator.
+        return (cls.validate,)
+
+    @classmethod
+    def validate(cls, value: Any) -> datetime:
+        """
+        Converts the given value to a `datetime` and makes sure it is in UTC.
+
+        `datetime` values (e.g. the ones loaded from the database) are used as is,
+        everything else is parsed with pydantic's default `datetime` parser.
+
+        Raises:
+            ValueError: If `value` is not a valid datetime or it's not in UTC.
+        """
+        return cls.ensure_utc(value if isinstance(value, datetime) else parse_datetime(value))
 
     @classmethod
     def ensure_utc(cls, value: datetime) -> datetime:
         """
         Makes sure the given datetime is in UTC.
 
-        If `value` has no timezone info, the method sets UTC.
+        If `value` has no timezone info or its timezone is equivalent to UTC
+        (it has zero UTC offset), the method sets `timezone.utc`.
 
         Raises:
             ValueError: If `value` has timezone info but it's not UTC.
         """
         tzinfo = value.tzinfo
-        if tzinfo is None:  # No timezone info, assume UTC.
-            return value.replace(tzinfo=timezone.utc)
-
-        if tzinfo == timezone.utc:  # Timezone is UTC, no-op.
+        if tzinfo is timezone.utc:  # Timezone is UTC, no-op.
             return value
 
+        if tzinfo is None or value.utcoffset() == _ZERO_OFFSET:  # No timezone info or UTC equivalent, set UTC.
+            return value.replace(tzinfo=timezone.utc)
+
         # Non-UTC timezone info, raise exception.
         raise ValueError("Non-UTC timezone.")
 
@@ -76,16 +107,27 @@ class StrObjectId(ObjectId):
     """
 
     @classmethod
-    def __get_validators__(cls) -> Generator[Callable[[Any], StrObjectId], None, None]:
-        yield cls.validate
+    def __get_validators__(cls) -> tuple[Callable[[Any], StrObjectId]]:
+        return (cls.validate,)
 
     @classmethod
     def validate(cls, value: Any) -> StrObjectId:
         """
-        Checks whether the given value is a valid `ObjectId`"""
-        if not ObjectId.is_valid(value):
-            raise ValueError("Invalid StrObjectId")
-        return cls(value)
+        Checks whether the given value is a valid `ObjectId` and converts it to `StrObjectId`.
+
+        Raises:
+            ValueError: If `value` is not a valid `ObjectId`.
+        """
+        # Construct the ID directly instead of calling `ObjectId.is_valid()` first,
+        # which would parse the value twice. `None` must be rejected explicitly,
+        # because `ObjectId(None)` generates a new ID.
+        if value is not None:
+            try:
+                return cls(value)
+            except (InvalidId, TypeError):
+                pass
+
+        raise ValueError("Invalid StrObjectId")
 
     @classmethod
     def __modify_schema__(cls, field_schema: dict[str, Any]) -> None:
@@ -105,6 +147,35 @@ class DocumentModel(BaseModel):
         arbitrary_types_allowed = True
         json_encoders = {ObjectId: str}
 
+    @classmethod
+    def from_mongo(cls: type[TDocumentModel], doc: Mapping[str, Any]) -> TDocumentModel:
+        """
+        Creates a model instance from a document that was loaded from the database *without validation*.
+
+        Only the declared fields of the model are loaded (by alias or by name), other keys of
+        the document are ignored.
+
+        Only use this method with trusted data, i.e. documents of a collection whose content
+        is fully controlled by the service layer, and never with partial (projected) documents.
+
+        Caveats (there is no validation or conversion):
+
+        - nested models remain plain `dict`s;
+        - `UTCDatetime` values are returned as they are loaded, which means they are naive
+          unless the collection's codec options are timezone-aware.
+
+        Arguments:
+            doc: The MongoDB document.
+        """
+        values: dict[str, Any] = {}
+        for name, field in cls.__fields__.items():
+            if field.alias in doc:
+                values[name] = doc[field.alias]
+            elif name in doc:
+                values[name] = doc[name]
+
+        return cls.construct(_fields_set=set(values), **values)
+
 
 class DeleteResultModel(BaseModel):
     """
@@ -112,3 +183,15 @@ class DeleteResultModel(BaseModel):
     """
 
     delete_count: int
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily imports the re-exported `AgnosticClient` and `AgnosticDatabase` types from `motor`.
+    """
+    if name in ("AgnosticClient", "AgnosticDatabase"):
+        from motor.core import AgnosticClient, AgnosticDatabase
+
+        return AgnosticClient if name == "AgnosticClient" else AgnosticDatabase
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
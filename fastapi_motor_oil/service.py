@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator, Callable, Coroutine, Generator, Mapping, Sequence
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator, Iterable, Mapping, Sequence
 from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from bson import ObjectId
 from pydantic import BaseModel
-from pymongo.results import DeleteResult, InsertOneResult, UpdateResult
+from pymongo.results import DeleteResult, InsertManyResult, InsertOneResult, UpdateResult
 
 if TYPE_CHECKING:
     from motor.core import (
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
         AgnosticLatentCommandCursor,
     )
 
-    from .model import AgnosticClient, AgnosticDatabase
+    from .model import AgnosticClient, AgnosticDatabase, DocumentModel
     from .typing import (
         AgnosticCollection,
         Collation,
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
         DeleteOptions,
         FindOptions,
         IndexData,
+        InsertManyOptions,
         InsertOneOptions,
         MongoProjection,
         MongoQuery,
@@ -37,12 +38,83 @@ from .validator import Validator
 __all__ = (
     "MongoService",
     "DeleteResult",
+    "InsertManyResult",
     "InsertOneResult",
     "UpdateResult",
+    "compile_projection",
 )
 
 TInsert = TypeVar("TInsert", bound=BaseModel)
 TUpdate = TypeVar("TUpdate", bound=BaseModel)
+TDocument = TypeVar("TDocument", bound="DocumentModel")
+
+_NESTED_VALUE_TYPES = (BaseModel, dict, list, tuple, set, frozenset)
+"""
+Value types that `BaseModel.dict()` converts recursively.
+"""
+
+
+_projection_cache: dict[frozenset[tuple[str, Any]], MongoProjection] = {}
+"""
+Cache of the projections that were created by `compile_projection()`.
+"""
+
+_PROJECTION_CACHE_SIZE = 256
+"""
+The maximum number of projections `compile_projection()` caches.
+"""
+
+
+def compile_projection(projection: Mapping[str, Any] | Iterable[str]) -> MongoProjection:
+    """
+    Converts the given projection into a `MongoProjection` dict and caches it by its content,
+    so equivalent projections share a single object.
+
+    Sequences of field names (e.g. `["name", "parent"]`) are converted into inclusion projections
+    (`{"name": True, "parent": True}`), so `pymongo` doesn't need to convert them on every query.
+
+    Call this function once, e.g. at module level, and pass the result to `find()`, `find_one()`,
+    and so on. The returned dict is shared, it must not be modified.
+
+    Only use it for static projections: the cache is capped at `_PROJECTION_CACHE_SIZE` entries,
+    projections beyond that are compiled but not cached.
+
+    Arguments:
+        projection: A projection object or a sequence of field names to include.
+
+    Returns:
+        The compiled projection.
+
+    Raises:
+        TypeError: If `projection` is a `str`.
+    """
+    if isinstance(projection, Mapping):
+        items = tuple(projection.items())
+    elif isinstance(projection, str):
+        raise TypeError("projection must be a mapping or a sequence of field names, not a str.")
+    else:
+        items = tuple((name, True) for name in projection)
+
+    try:
+        key = frozenset(items)
+    except TypeError:  # Unhashable values, e.g. projection operators like $slice. Skip caching.
+        return dict(items)
+
+    if (result := _projection_cache.get(key)) is None:
+        result = dict(items)
+        if len(_projection_cache) < _PROJECTION_CACHE_SIZE:
+            result = _projection_cache.setdefault(key, result)
+
+    return result
+
+
+def _merge_options(options: Mapping[str, Any] | None, kwargs: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merges the given `options` and keyword arguments into a new dict, keyword arguments take precedence.
+
+    If `options` is empty, `kwargs` is returned as is.
+    """
+    return {**options, **kwargs} if options else kwargs
 
 
 class MongoService(Generic[TInsert, TUpdate]):
@@ -57,15 +129,28 @@ class MongoService(Generic[TInsert, TUpdate]):
 
     For insert and update data validation, see `Validator`, `_validate_insert()`, and `_validate_update()`
 
+    Methods with an `options` argument also accept the same options as keyword arguments,
+    which take precedence over the values in `options`.
+
     Class attributes:
         collection_name: The name of the collection the service operates on. Must be set by subclasses.
         collection_options: Optional `CollectionOptions` dict.
     """
 
     __slots__ = (
-        "_collection",
+        "collection",
         "_database",
         "_supports_transactions",
+        "_c_aggregate",
+        "_c_count_documents",
+        "_c_delete_many",
+        "_c_delete_one",
+        "_c_find",
+        "_c_find_one",
+        "_c_insert_many",
+        "_c_insert_one",
+        "_c_update_many",
+        "_c_update_one",
     )
 
     collection_name: str
@@ -83,6 +168,14 @@ class MongoService(Generic[TInsert, TUpdate]):
     The full description of the indexes (if any) of the collection.
     """
 
+    collection: AgnosticCollection
+    """
+    The collection instance of the service, created by `_create_collection()` during initialization.
+
+    The service binds the frequently used methods of the collection during initialization,
+    so the attribute must not be replaced afterwards.
+    """
+
     def __init__(self, database: AgnosticDatabase) -> None:
         """
         Initialization.
@@ -94,8 +187,21 @@ class MongoService(Generic[TInsert, TUpdate]):
             raise ValueError("MongoService.collection_name is not initialized.")
 
         self._database = database
-        self._collection: AgnosticCollection | None = None
         self._supports_transactions: bool | None = None
+        self.collection = self._create_collection()
+
+        # Bind the frequently used collection methods once to save the attribute lookups on every call.
+        collection = self.collection
+        self._c_aggregate = collection.aggregate
+        self._c_count_documents = collection.count_documents
+        self._c_delete_many = collection.delete_many
+        self._c_delete_one = collection.delete_one
+        self._c_find = collection.find
+        self._c_find_one = collection.find_one
+        self._c_insert_many = collection.insert_many
+        self._c_insert_one = collection.insert_one
+        self._c_update_many = collection.update_many
+        self._c_update_one = collection.update_one
 
     @property
     def client(self) -> AgnosticClient:
@@ -104,16 +210,6 @@ class MongoService(Generic[TInsert, TUpdate]):
         """
         return self._database.client
 
-    @property
-    def collection(self) -> AgnosticCollection:
-        """
-        The collection instance of the service.
-        """
-        if self._collection is None:
-            self._collection = self._create_collection()
-
-        return self._collection
-
     async def supports_transactions(self) -> bool:
         """
         Queries the database if it supports transactions or not.
@@ -140,9 +236,9 @@ class MongoService(Generic[TInsert, TUpdate]):
             pipeline: The aggregation pipeline.
             session: An optional session to use.
         """
-        return self.collection.aggregate(pipeline, session=session, **kwargs)
+        return self._c_aggregate(pipeline, session=session, **kwargs)
 
-    async def count_documents(self, query: MongoQuery, *, options: FindOptions | None = None) -> int:
+    async def count_documents(self, query: MongoQuery, *, options: FindOptions | None = None, **kwargs: Any) -> int:
         """
         Returns the number of documents that match the given query.
 
@@ -153,7 +249,10 @@ class MongoService(Generic[TInsert, TUpdate]):
         Returns:
             The number of matching documents.
         """
-        return await self.collection.count_documents(query, **(options or {}))  # type: ignore[no-any-return]
+        if opts := _merge_options(options, kwargs):
+            return await self._c_count_documents(query, **opts)  # type: ignore[no-any-return]
+
+        return await self._c_count_documents(query)  # type: ignore[no-any-return]
 
     async def create_index(
         self,
@@ -253,17 +352,19 @@ class MongoService(Generic[TInsert, TUpdate]):
         """
         return self.collection.list_indexes(session, **kwargs)
 
-    async def delete_by_id(
+    def delete_by_id(
         self,
         id: ObjectId,
         *,
         options: DeleteOptions | None = None,
-    ) -> DeleteResult:
+        **kwargs: Any,
+    ) -> Awaitable[DeleteResult]:
         """
         Deletes the document with the given ID.
 
         This method is just a convenience wrapper around `delete_one()`, see that
-        method for more details.
+        method for more details. It returns the awaitable of `delete_one()` as is,
+        without wrapping it in another coroutine.
 
         Arguments:
             id: The ID of the document to delete.
@@ -272,13 +373,14 @@ class MongoService(Generic[TInsert, TUpdate]):
         Returns:
             The result of the operation.
         """
-        return await self.delete_one({"_id": id}, options=options)
+        return self.delete_one({"_id": id}, options=options, **kwargs)
 
     async def delete_many(
         self,
         query: MongoQuery | None,
         *,
         options: DeleteOptions | None = None,
+        **kwargs: Any,
     ) -> DeleteResult:
         """
         The default `delete_many()` implementation of the service.
@@ -299,9 +401,9 @@ class MongoService(Generic[TInsert, TUpdate]):
         Returns:
             The result of the operation.
         """
-        session_manager = self._get_session_context_manager(options.get("session", None) if options else None)
+        opts = _merge_options(options, kwargs)
+        session_manager = self._get_session_context_manager(opts.get("session", None))
         async with await session_manager() as session:
-            opts: DeleteOptions = options or {}
             opts["session"] = session
             ctxman = (
                 nullcontext
@@ -325,7 +427,7 @@ class MongoService(Generic[TInsert, TUpdate]):
                         ids,  # type: ignore[arg-type] # can not be None if has_ids is True
                     )
 
-                result = await self.collection.delete_many(query, **opts)
+                result = await self._c_delete_many(query, **opts)
 
                 if has_ids:
                     await self._validate_post_delete(
@@ -340,6 +442,7 @@ class MongoService(Generic[TInsert, TUpdate]):
         query: MongoQuery | None,
         *,
         options: DeleteOptions | None = None,
+        **kwargs: Any,
     ) -> DeleteResult:
         """
         The default `delete_one()` implementation of the service.
@@ -360,9 +463,9 @@ class MongoService(Generic[TInsert, TUpdate]):
         Returns:
             The result of the operation.
         """
-        session_manager = self._get_session_context_manager(options.get("session", None) if options else None)
+        opts = _merge_options(options, kwargs)
+        session_manager = self._get_session_context_manager(opts.get("session", None))
         async with await session_manager() as session:
-            opts: DeleteOptions = options or {}
             opts["session"] = session
             ctxman = (
                 nullcontext
@@ -383,14 +486,14 @@ class MongoService(Generic[TInsert, TUpdate]):
                     await self._validate_deny_delete(session, ids)
                     await self._validate_pre_delete(session, ids)
 
-                result = await self.collection.delete_one(query, **opts)
+                result = await self._c_delete_one(query, **opts)
 
                 if ids is not None:
                     await self._validate_post_delete(session, ids)
 
                 return result  # type: ignore[no-any-return]
 
-    async def exists(self, id: ObjectId, *, options: FindOptions | None = None) -> bool:
+    async def exists(self, id: ObjectId, *, options: FindOptions | None = None, **kwargs: Any) -> bool:
         """
         Returns whether the document with the given ID exists.
 
@@ -401,7 +504,7 @@ class MongoService(Generic[TInsert, TUpdate]):
         Returns:
             Whether the document with the given ID exists.
         """
-        return await self.count_documents({"_id": id}, options=options) == 1
+        return await self.count_documents({"_id": id}, options=options, **kwargs) == 1
 
     def find(
         self,
@@ -409,6 +512,7 @@ class MongoService(Generic[TInsert, TUpdate]):
         projection: MongoProjection | None = None,
         *,
         options: FindOptions | None = None,
+        **kwargs: Any,
     ) -> AgnosticCursor:
         """
         The default `find()` implementation of the service.
@@ -421,7 +525,10 @@ class MongoService(Generic[TInsert, TUpdate]):
         Returns:
             An async database cursor.
         """
-        return self.collection.find(query, projection, **(options or {}))
+        if opts := _merge_options(options, kwargs):
+            return self._c_find(query, projection, **opts)
+
+        return self._c_find(query, projection)
 
     async def find_ids(
         self,
@@ -439,7 +546,39 @@ class MongoService(Generic[TInsert, TUpdate]):
         Returns:
             The IDs of all matching documents.
         """
-        return [doc["_id"] for doc in await self.collection.find(query, {"_id": True}, session=session).to_list(None)]
+        return [doc["_id"] for doc in await self._c_find(query, {"_id": True}, session=session).to_list(None)]
+
+    async def find_many_as(
+        self,
+        model: type[TDocument],
+        query: MongoQuery | None = None,
+        *,
+        options: FindOptions | None = None,
+        **kwargs: Any,
+    ) -> list[TDocument]:
+        """
+        Same as `find()`, but it loads all matching documents and converts them into `model`
+        instances with `DocumentModel.from_mongo()`, which skips validation.
+
+        Only use this method if the content of the collection is fully controlled by
+        the service layer, so loaded documents are known to be valid.
+
+        Arguments:
+            model: The document model to convert the matching documents to.
+            query: The query object.
+            options: Query options, see the arguments of `collection.find()` for details.
+
+        Returns:
+            The matching documents as `model` instances.
+
+        Raises:
+            TypeError: If a `projection` is given, partial documents must not be converted to models.
+        """
+        if "projection" in kwargs:
+            raise TypeError("find_many_as() does not support projections.")
+
+        from_mongo = model.from_mongo
+        return [from_mongo(doc) async for doc in self.find(query, options=options, **kwargs)]
 
     async def find_one(
         self,
@@ -447,6 +586,7 @@ class MongoService(Generic[TInsert, TUpdate]):
         projection: MongoProjection | None = None,
         *,
         options: FindOptions | None = None,
+        **kwargs: Any,
     ) -> dict[str, Any] | None:
         """
         The default `find_one()` implementation of the service.
@@ -459,7 +599,42 @@ class MongoService(Generic[TInsert, TUpdate]):
         Returns:
             A single matching document or `None` if there are no matches.
         """
-        return await self.collection.find_one(query, projection, **(options or {}))  # type: ignore[no-any-return]
+        if opts := _merge_options(options, kwargs):
+            return await self._c_find_one(query, projection, **opts)  # type: ignore[no-any-return]
+
+        return await self._c_find_one(query, projection)  # type: ignore[no-any-return]
+
+    async def find_one_as(
+        self,
+        model: type[TDocument],
+        query: MongoQuery | None = None,
+        *,
+        options: FindOptions | None = None,
+        **kwargs: Any,
+    ) -> TDocument | None:
+        """
+        Same as `find_one()`, but it converts the matching document into a `model` instance
+        with `DocumentModel.from_mongo()`, which skips validation.
+
+        Only use this method if the content of the collection is fully controlled by
+        the service layer, so loaded documents are known to be valid.
+
+        Arguments:
+            model: The document model to convert the matching document to.
+            query: The query object.
+            options: Query options, see the arguments of `collection.find()` for details.
+
+        Returns:
+            The matching document as a `model` instance or `None` if there are no matches.
+
+        Raises:
+            TypeError: If a `projection` is given, partial documents must not be converted to models.
+        """
+        if "projection" in kwargs:
+            raise TypeError("find_one_as() does not support projections.")
+
+        doc = await self.find_one(query, options=options, **kwargs)
+        return None if doc is None else model.from_mongo(doc)
 
     async def get_by_id(
         self,
@@ -467,6 +642,7 @@ class MongoService(Generic[TInsert, TUpdate]):
         projection: MongoProjection | None = None,
         *,
         options: FindOptions | None = None,
+        **kwargs: Any,
     ) -> dict[str, Any] | None:
         """
         Returns the document with the given ID if it exists.
@@ -479,9 +655,11 @@ class MongoService(Generic[TInsert, TUpdate]):
         Returns:
             The queried document if such a document exists.
         """
-        return await self.find_one({"_id": id}, projection, options=options)
+        return await self.find_one({"_id": id}, projection, options=options, **kwargs)
 
-    async def insert_one(self, data: TInsert, *, options: InsertOneOptions | None = None) -> InsertOneResult:
+    async def insert_one(
+        self, data: TInsert, *, options: InsertOneOptions | None = None, **kwargs: Any
+    ) -> InsertOneResult:
         """
         Inserts the given data into the collection.
 
@@ -495,21 +673,51 @@ class MongoService(Generic[TInsert, TUpdate]):
         Raises:
             Exception: if the data is invalid.
         """
-        return await self.collection.insert_one(  # type: ignore[no-any-return]
-            await self._prepare_for_insert(None, data),
-            **(options or {}),
-        )
+        document = await self._prepare_for_insert(None, data)
+        if opts := _merge_options(options, kwargs):
+            return await self._c_insert_one(document, **opts)  # type: ignore[no-any-return]
 
-    async def update_by_id(
+        return await self._c_insert_one(document)  # type: ignore[no-any-return]
+
+    async def insert_many(
+        self, data: Iterable[TInsert], *, options: InsertManyOptions | None = None, **kwargs: Any
+    ) -> InsertManyResult:
+        """
+        Inserts the given items into the collection in a single database operation.
+
+        Every item is validated and converted the same way as in `insert_one()`, and
+        the operation is only executed if all items are valid.
+
+        Arguments:
+            data: The items to be inserted, must not be empty.
+            options: Insert options, see the arguments of `collection.insert_many()` for details.
+
+        Returns:
+            The result of the operation.
+
+        Raises:
+            Exception: if one of the items is invalid.
+        """
+        documents = [await self._prepare_for_insert(None, item) for item in data]
+        if opts := _merge_options(options, kwargs):
+            return await self._c_insert_many(documents, **opts)  # type: ignore[no-any-return]
+
+        return await self._c_insert_many(documents)  # type: ignore[no-any-return]
+
+    def update_by_id(
         self,
         id: ObjectId,
         changes: TUpdate,
         *,
         options: UpdateOneOptions | None = None,
-    ) -> UpdateResult:
+        **kwargs: Any,
+    ) -> Awaitable[UpdateResult]:
         """
         Updates the document with the given ID.
 
+        This method is just a convenience wrapper around `update_one()`, it returns
+        the awaitable of `update_one()` as is, without wrapping it in another coroutine.
+
         Arguments:
             id: The ID of the document to update.
             changes: The changes to make.
@@ -521,7 +729,7 @@ class MongoService(Generic[TInsert, TUpdate]):
         Raises:
             Exception: if the data is invalid.
         """
-        return await self.update_one({"_id": id}, changes, options=options)
+        return self.update_one({"_id": id}, changes, options=options, **kwargs)
 
     async def update_many(
         self,
@@ -529,6 +737,7 @@ class MongoService(Generic[TInsert, TUpdate]):
         changes: TUpdate,
         *,
         options: UpdateManyOptions | None = None,
+        **kwargs: Any,
     ) -> UpdateResult:
         """
         The default `delete_many()` implementation of the service.
@@ -544,11 +753,11 @@ class MongoService(Generic[TInsert, TUpdate]):
         Raises:
             Exception: if the data is invalid.
         """
-        return await self.collection.update_many(  # type: ignore[no-any-return]
-            query,
-            await self._prepare_for_update(query, changes),
-            **(options or {}),
-        )
+        update = await self._prepare_for_update(query, changes)
+        if opts := _merge_options(options, kwargs):
+            return await self._c_update_many(query, update, **opts)  # type: ignore[no-any-return]
+
+        return await self._c_update_many(query, update)  # type: ignore[no-any-return]
 
     async def update_one(
         self,
@@ -556,6 +765,7 @@ class MongoService(Generic[TInsert, TUpdate]):
         changes: TUpdate,
         *,
         options: UpdateOneOptions | None = None,
+        **kwargs: Any,
     ) -> UpdateResult:
         """
         The default `delete_one()` implementation of the service.
@@ -571,11 +781,11 @@ class MongoService(Generic[TInsert, TUpdate]):
         Raises:
             Exception: if the data is invalid.
         """
-        return await self.collection.update_one(  # type: ignore[no-any-return]
-            query,
-            await self._prepare_for_update(query, changes),
-            **(options or {}),
-        )
+        update = await self._prepare_for_update(query, changes)
+        if opts := _merge_options(options, kwargs):
+            return await self._c_update_one(query, update, **opts)  # type: ignore[no-any-return]
+
+        return await self._c_update_one(query, update)  # type: ignore[no-any-return]
 
     async def _convert_for_insert(self, data: TInsert) -> dict[str, Any]:
         """
@@ -598,7 +808,10 @@ class MongoService(Generic[TInsert, TUpdate]):
         """
         Converts the given piece of data into an update object.
 
-        The default implementation is `{"$set": data.dict(exclude_unset=True)}`.
+        The default implementation is equivalent to `{"$set": data.dict(exclude_unset=True)}`,
+        but it only visits the explicitly set fields of `data` and uses `data.dict()` only
+        for the ones that hold nested values (models or containers). Models that override
+        `dict()` are always converted with `data.dict(exclude_unset=True)`.
 
         Arguments:
             data: The update data.
@@ -609,13 +822,31 @@ class MongoService(Generic[TInsert, TUpdate]):
         Raises:
             Exception: if the data is invalid.
         """
-        return {"$set": data.dict(exclude_unset=True)}
+        if (
+            type(data).dict is not BaseModel.dict
+            or data.__include_fields__ is not None
+            or data.__exclude_fields__ is not None
+        ):
+            # Custom dict() implementations and field-level include/exclude settings are only handled by dict().
+            return {"$set": data.dict(exclude_unset=True)}
+
+        values = data.__dict__
+        changes = {name: values[name] for name in data.__fields_set__}
+        if nested := {name for name, value in changes.items() if isinstance(value, _NESTED_VALUE_TYPES)}:
+            changes.update(data.dict(include=nested, exclude_unset=True))
+
+        return {"$set": changes}
 
     def _create_collection(self) -> AgnosticCollection:
         """
         Creates a new `AgnosticCollection` instance for the service.
+
+        The method is called once, during the initialization of the service.
         """
-        return self._database.get_collection(self.collection_name, **(self.collection_options or {}))
+        if self.collection_options:
+            return self._database.get_collection(self.collection_name, **self.collection_options)
+
+        return self._database.get_collection(self.collection_name)
 
     def _delete_rules(self) -> Generator[DeleteRule["MongoService[TInsert, TUpdate]"], None, None]:
         """
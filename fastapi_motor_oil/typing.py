@@ -4,11 +4,11 @@ from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, TypedDict
 
-from motor.core import AgnosticCollection
 from pymongo.collation import Collation as PMCollation
 
 if TYPE_CHECKING:
     from bson.codec_options import CodecOptions
+    from motor.core import AgnosticClientSession, AgnosticCollection
     from pymongo.read_concern import ReadConcern
     from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
     from pymongo.write_concern import WriteConcern
@@ -25,6 +25,7 @@ __all__ = (
     "DeleteOptions",
     "FindOptions",
     "IndexData",
+    "InsertManyOptions",
     "InsertOneOptions",
     "UpdateOneOptions",
     "UpdateManyOptions",
@@ -132,6 +133,17 @@ class IndexData:
     extra: dict[str, Any] = field(default_factory=dict)
 
 
+class InsertManyOptions(TypedDict, total=False):
+    """
+    Insert-many options.
+    """
+
+    ordered: bool  # Default is True
+    bypass_document_validation: bool  # Default is False
+    session: AgnosticClientSession | None  # Default is None
+    comment: Any | None  # Default is None
+
+
 class InsertOneOptions(TypedDict, total=False):
     """
     Insert options.
@@ -170,3 +182,15 @@ class UpdateManyOptions(TypedDict, total=False):
     session: AgnosticCollection | None  # Default is None
     let: Mapping[str, Any] | None  # Default is None
     comment: Any | None  # Default is None
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily imports `AgnosticCollection` from `motor`, it is only needed for type checking otherwise.
+    """
+    if name == "AgnosticCollection":
+        from motor.core import AgnosticCollection
+
+        return AgnosticCollection
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")